@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Optional, Dict
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+import hashlib
 import math
+import mmap
+import os
+import struct
+import sys
+import threading
 
 
 class Move:
@@ -309,6 +317,131 @@ class Checker(Piece):
         return capture_moves if capture_moves else moves
 
 
+_zobrist_cache: Dict[Tuple[str, str, int], int] = {}
+
+
+def _zobrist_value(kind: str, color: str, square: int) -> int:
+    """Детерминированное случайное число для ключа Зобриста"""
+    token = (kind, color, square)
+    value = _zobrist_cache.get(token)
+    if value is None:
+        digest = hashlib.blake2b(f"{kind}:{color}:{square}".encode(), digest_size=8).digest()
+        value = _zobrist_cache[token] = int.from_bytes(digest, 'little')
+    return value
+
+
+# С Python 3.13 отслеживание сегментов можно отключить напрямую
+_SHM_UNTRACKED = {'track': False} if sys.version_info >= (3, 13) else {}
+_shm_tracker_lock = threading.Lock()
+
+
+@contextmanager
+def _untracked_shm():
+    """Не сообщать resource_tracker о сегменте (для Python < 3.13)
+
+    Трекер удаляет "утекшие" сегменты при выходе процесса, а у воркеров
+    пула он общий с родителем, и повторные register/unregister ломаются.
+    Таблица живет до явного PositionStore.unlink().
+    """
+    if _SHM_UNTRACKED:
+        yield
+        return
+    with _shm_tracker_lock:
+        register, unregister = resource_tracker.register, resource_tracker.unregister
+        resource_tracker.register = resource_tracker.unregister = lambda name, rtype: None
+        try:
+            yield
+        finally:
+            resource_tracker.register, resource_tracker.unregister = register, unregister
+
+
+class PositionStore:
+    """Общая для процессов хеш-таблица позиций (транспозиции и оценки)
+
+    Таблица лежит в multiprocessing.shared_memory или в mmap-файле (тогда
+    переживает перезапуск процессов). Блокировки не нужны: в ячейке хранится
+    пара (ключ ^ данные, данные), и порванная запись просто не совпадёт с ключом.
+    """
+
+    ENTRY = struct.Struct('<QQ')
+    VALID = 1 << 63
+
+    # Тип оценки для отсечений альфа-бета
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, size: int = 1 << 16, path: Optional[str] = None, name: Optional[str] = None):
+        nbytes = size * self.ENTRY.size
+        self._file = None
+        self._shm = None
+        if path is not None:
+            # Файловая таблица: переживает перезапуск воркеров
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(fd).st_size < nbytes:
+                os.ftruncate(fd, nbytes)
+            self._file = fd
+            self.buf = mmap.mmap(fd, 0)
+            nbytes = len(self.buf)
+        else:
+            # Разделяемая память: первый процесс создаёт, остальные подключаются по имени
+            with _untracked_shm():
+                try:
+                    self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes, **_SHM_UNTRACKED)
+                except FileExistsError:
+                    self._shm = shared_memory.SharedMemory(name=name, **_SHM_UNTRACKED)
+            self.buf = self._shm.buf
+            nbytes = self._shm.size
+        # Размер берём из уже существующей таблицы, а не из аргумента
+        self.size = nbytes // self.ENTRY.size
+        self.name = self._shm.name if self._shm else path
+
+    def _offset(self, key: int) -> int:
+        """Смещение ячейки для ключа"""
+        if not 0 <= key < 1 << 64:
+            raise ValueError("Ключ должен быть 64-битным беззнаковым числом")
+        return (key % self.size) * self.ENTRY.size
+
+    def get(self, key: int) -> Optional[Tuple[int, int, int]]:
+        """Получить (оценка, глубина, тип оценки) для позиции или None"""
+        check, data = self.ENTRY.unpack_from(self.buf, self._offset(key))
+        if not data & self.VALID or check ^ data != key:
+            return None
+        value = (data & 0xFFFFFFFF) - (1 << 31)
+        depth = (data >> 32) & 0xFFFF
+        bound = (data >> 48) & 0x3
+        return value, depth, bound
+
+    def put(self, key: int, value: int, depth: int = 0, bound: int = EXACT):
+        """Сохранить оценку позиции (более глубокая запись не затирается)"""
+        if not -(1 << 31) <= value < 1 << 31:
+            raise ValueError("Оценка должна помещаться в 32 бита со знаком")
+        if not 0 <= depth <= 0xFFFF:
+            raise ValueError("Глубина должна быть от 0 до 65535")
+        if bound not in (self.EXACT, self.LOWER, self.UPPER):
+            raise ValueError("Тип оценки должен быть EXACT, LOWER или UPPER")
+        offset = self._offset(key)
+        check, data = self.ENTRY.unpack_from(self.buf, offset)
+        if data & self.VALID and check ^ data == key and (data >> 32) & 0xFFFF > depth:
+            return
+        data = self.VALID | bound << 48 | depth << 32 | value + (1 << 31)
+        self.ENTRY.pack_into(self.buf, offset, key ^ data, data)
+
+    def close(self):
+        """Отключиться от таблицы (данные остаются)"""
+        if self._shm is not None:
+            self.buf = None
+            self._shm.close()
+        else:
+            self.buf.flush()
+            self.buf.close()
+            os.close(self._file)
+
+    def unlink(self):
+        """Удалить разделяемую память после завершения всех воркеров"""
+        if self._shm is not None:
+            with _untracked_shm():
+                self._shm.unlink()
+
+
 class Board:
     """Класс игровой доски"""
 
@@ -421,12 +554,8 @@ class Board:
             return False
 
         # Проверка допустимости хода для текущего типа игры
-        if self.game_type == 'hex_chess':
-            if not self.is_valid_hex_position(start) or not self.is_valid_hex_position(end):
-                return False
-        else:
-            if not (0 <= start[0] < 8 and 0 <= start[1] < 8 and 0 <= end[0] < 8 and 0 <= end[1] < 8):
-                return False
+        if not self._is_on_board(start) or not self._is_on_board(end):
+            return False
 
         if end not in piece.get_moves(self, start):
             return False
@@ -462,6 +591,116 @@ class Board:
         move.piece_moved.has_moved = len(self.move_history) > 0
         return True
 
+    def position_key(self, player: str) -> int:
+        """64-битный ключ Зобриста для позиции (одинаков во всех процессах)"""
+        key = _zobrist_value('side', player, 0)
+        for x, row in enumerate(self.grid):
+            for y, piece in enumerate(row):
+                if piece is not None:
+                    kind = type(piece).__name__
+                    if getattr(piece, 'is_king', False):
+                        kind += '+'
+                    key ^= _zobrist_value(kind, piece.color, x * 11 + y)
+        return key
+
+    def _pieces(self, color: str) -> List[Tuple[Tuple[int, int], Piece]]:
+        """Все фигуры заданного цвета на доске с их позициями"""
+        # Фигуры вне доски (есть в расстановке Глинского) ходить не могут, как и в move_piece
+        return [((x, y), piece) for x, row in enumerate(self.grid) for y, piece in enumerate(row)
+                if piece is not None and piece.color == color and self._is_on_board((x, y))]
+
+    def find_king(self, color: str) -> Optional[Tuple[int, int]]:
+        """Найти позицию короля"""
+        for pos, piece in self._pieces(color):
+            if isinstance(piece, (King, HexKing)):
+                return pos
+        return None
+
+    def attackers(self, pos: Tuple[int, int], color: str, limit: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Позиции фигур цвета color, которые бьют клетку pos (не больше limit)"""
+        found = []
+        for start, piece in self._pieces(color):
+            if pos in piece.get_moves(self, start):
+                found.append(start)
+                if len(found) == limit:
+                    break
+        return found
+
+    def is_in_check(self, color: str) -> bool:
+        """Находится ли король под шахом"""
+        king_pos = self.find_king(color)
+        if king_pos is None:
+            return False
+        opponent = 'black' if color == 'white' else 'white'
+        return bool(self.attackers(king_pos, opponent, limit=1))
+
+    def _is_safe_move(self, start: Tuple[int, int], end: Tuple[int, int], color: str) -> bool:
+        """Пробный ход без записи в историю: не остается ли король под шахом"""
+        piece, captured = self.grid[start[0]][start[1]], self.grid[end[0]][end[1]]
+        self.grid[end[0]][end[1]] = piece
+        self.grid[start[0]][start[1]] = None
+        try:
+            return not self.is_in_check(color)
+        finally:
+            self.grid[start[0]][start[1]] = piece
+            self.grid[end[0]][end[1]] = captured
+
+    def _is_on_board(self, pos: Tuple[int, int]) -> bool:
+        """Проверить, что клетка лежит на доске текущей игры"""
+        if self.game_type == 'hex_chess':
+            return self.is_valid_hex_position(pos)
+        return 0 <= pos[0] < 8 and 0 <= pos[1] < 8
+
+    def _moves(self, pos: Tuple[int, int], piece: Piece) -> List[Tuple[int, int]]:
+        """Ходы фигуры без клеток за пределами доски"""
+        return [end for end in piece.get_moves(self, pos) if self._is_on_board(end)]
+
+    def _squares_between(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Клетки на луче между дальнобойной фигурой и целью"""
+        if not isinstance(self.get_piece(start), (Rook, Bishop, Queen, HexRook, HexBishop, HexQueen)):
+            return []  # Шах конем, пешкой или королем не закрыть
+        dx, dy = end[0] - start[0], end[1] - start[1]
+        step_x, step_y = (dx > 0) - (dx < 0), (dy > 0) - (dy < 0)
+        return [(start[0] + step_x * i, start[1] + step_y * i) for i in range(1, max(abs(dx), abs(dy)))]
+
+    def has_legal_move(self, color: str) -> bool:
+        """Есть ли хотя бы один допустимый ход (перебор до первого найденного)"""
+        king_pos = self.find_king(color)
+        if self.game_type == 'checkers' or king_pos is None:
+            # Без короля шаха не бывает: достаточно любого хода
+            return any(self._moves(pos, piece) for pos, piece in self._pieces(color))
+
+        # Сначала уход короля — самый частый способ выйти из-под шаха
+        king = self.get_piece(king_pos)
+        for end in self._moves(king_pos, king):
+            if self._is_safe_move(king_pos, end, color):
+                return True
+
+        opponent = 'black' if color == 'white' else 'white'
+        attacking = self.attackers(king_pos, opponent, limit=2)
+        if len(attacking) > 1:
+            # При двойном шахе спасает только ход короля
+            return False
+
+        others = [(pos, piece) for pos, piece in self._pieces(color) if pos != king_pos]
+        if attacking:
+            # Под шахом: взятие атакующей фигуры, затем закрытие линии шаха
+            target = attacking[0]
+            blocks = set(self._squares_between(target, king_pos))
+            block_moves = []
+            for pos, piece in others:
+                ends = self._moves(pos, piece)
+                if target in ends and self._is_safe_move(pos, target, color):
+                    return True
+                block_moves.extend((pos, end) for end in ends if end in blocks)
+            return any(self._is_safe_move(pos, end, color) for pos, end in block_moves)
+
+        for pos, piece in others:
+            for end in self._moves(pos, piece):
+                if self._is_safe_move(pos, end, color):
+                    return True
+        return False
+
     def get_piece(self, pos: Tuple[int, int]) -> Optional[Piece]:
         """Получить фигуру по позиции"""
         return self.grid[pos[0]][pos[1]]
@@ -628,11 +867,31 @@ class ChessGame:
                     print(f"Ход {parts[0]}→{parts[1]} выполнен")
                     self._switch_player()
                     self.move_count += 1
+
+                    result = self.game_over_message()
+                    if result:
+                        self.board.display()
+                        print(result)
+                        break
                 else:
                     print("Недопустимый ход! Попробуйте еще.")
             except Exception as e:
                 print(f"Ошибка: {e}. Введите ход в формате 'e2 e4'")
 
+    def game_over_message(self) -> Optional[str]:
+        """Проверить окончание игры для текущего игрока"""
+        if self.board.has_legal_move(self.current_player):
+            return None
+        winner = 'белые' if self.current_player == 'black' else 'черные'
+        if self.game_type == 'checkers':
+            return f"Нет ходов! Победили {winner}"
+        if self.board.is_in_check(self.current_player):
+            return f"Мат! Победили {winner}"
+        if self.game_type == 'hex_chess':
+            # В шахматах Глинского пат не ничья: поставивший пат получает ¾ очка
+            return f"Пат! {winner.capitalize()} получают ¾ очка, соперник — ¼"
+        return "Пат! Ничья"
+
     def _parse_pos(self, pos_str: str) -> Tuple[int, int]:
         """Преобразовать строку (например 'e2') в координаты доски"""
         if len(pos_str) != 2:
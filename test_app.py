@@ -0,0 +1,194 @@
+import pytest
+
+from app import Bishop, Board, ChessGame, Checker, HexKing, HexKnight, HexQueen, King, Pawn, PositionStore, Queen, Rook
+
+
+def _empty_game(game_type, player):
+    game = ChessGame(game_type)
+    game.board.grid = [[None for _ in range(11)] for _ in range(11)]
+    game.current_player = player
+    return game
+
+
+def _stalemate_game():
+    """Черный король a8 против белых ферзя c7 и короля c6"""
+    game = _empty_game('chess', 'black')
+    game.board.grid[0][0] = King('black', 'K')
+    game.board.grid[1][2] = Queen('white', 'Q')
+    game.board.grid[2][2] = King('white', 'K')
+    return game
+
+
+def test_start_positions_are_not_over():
+    for game_type in ('chess', 'checkers'):
+        assert ChessGame(game_type).game_over_message() is None
+
+
+def test_hex_start_probe_matches_move_piece():
+    # Базовая расстановка Глинского оставляет на доске только фигуры без ходов
+    board = Board('hex_chess')
+    squares = [(x, y) for x in range(11) for y in range(11)]
+    playable = any(board.move_piece(start, end) for start in squares for end in squares
+                   if board.get_piece(start) and board.get_piece(start).color == 'white')
+    assert board.has_legal_move('white') == playable
+
+
+def test_fools_mate():
+    game = ChessGame()
+    for start, end in [((6, 5), (5, 5)), ((1, 4), (3, 4)), ((6, 6), (4, 6)), ((0, 3), (4, 7))]:
+        assert game.board.move_piece(start, end)
+    assert game.game_over_message() == "Мат! Победили черные"
+
+
+def test_stalemate():
+    assert _stalemate_game().game_over_message() == "Пат! Ничья"
+
+
+def test_stalemate_with_stuck_pawn():
+    # Пешка на последней горизонтали не дает ходов за пределы доски
+    game = _stalemate_game()
+    game.board.grid[7][7] = Pawn('black', 'P')
+    game.board.grid[7][7].has_moved = True
+    assert game.game_over_message() == "Пат! Ничья"
+
+
+def test_check_escaped_by_capture():
+    board = Board()
+    board.grid = [[None for _ in range(11)] for _ in range(11)]
+    board.grid[0][0] = King('black', 'K')
+    board.grid[1][1] = Queen('white', 'Q')
+    board.grid[7][7] = King('white', 'K')
+    assert board.has_legal_move('black')
+
+    # Защищенного ферзя взять нельзя
+    board.grid[2][2] = King('white', 'K')
+    board.grid[7][7] = None
+    assert not board.has_legal_move('black')
+
+
+def test_check_escaped_by_block():
+    board = Board()
+    board.grid = [[None for _ in range(11)] for _ in range(11)]
+    board.grid[0][7] = King('black', 'K')
+    board.grid[1][6] = Pawn('black', 'P')
+    board.grid[1][7] = Pawn('black', 'P')
+    board.grid[0][0] = Rook('white', 'R')
+    board.grid[7][7] = King('white', 'K')
+    assert not board.has_legal_move('black')
+
+    # Слон c6 закрывает линию шаха на e8
+    board.grid[2][2] = Bishop('black', 'B')
+    assert board.has_legal_move('black')
+    assert board._squares_between((0, 0), (0, 7)) == [(0, i) for i in range(1, 7)]
+
+
+def test_hex_checkmate():
+    game = _empty_game('hex_chess', 'black')
+    game.board.grid[0][5] = HexKing('black', 'K')
+    game.board.grid[1][6] = HexKing('white', 'K')
+    game.board.grid[1][5] = HexQueen('white', 'Q')
+    assert game.game_over_message() == "Мат! Победили белые"
+
+
+def test_hex_stalemate_is_not_a_draw():
+    game = _empty_game('hex_chess', 'black')
+    game.board.grid[0][5] = HexKing('black', 'K')
+    game.board.grid[1][6] = HexKing('white', 'K')
+    game.board.grid[2][4] = HexQueen('white', 'Q')
+    assert game.game_over_message() == "Пат! Белые получают ¾ очка, соперник — ¼"
+
+
+def test_hex_pieces_off_board_are_ignored():
+    # (10, 2) и (0, 2) из начальной расстановки лежат вне шестиугольника
+    game = _empty_game('hex_chess', 'black')
+    game.board.grid[0][5] = HexKing('black', 'K')
+    game.board.grid[1][6] = HexKing('white', 'K')
+    game.board.grid[2][4] = HexQueen('white', 'Q')
+    game.board.grid[10][2] = HexKnight('black', 'N')
+    assert game.game_over_message() == "Пат! Белые получают ¾ очка, соперник — ¼"
+
+    game.board.grid[2][4] = None
+    game.board.grid[0][2] = HexKnight('white', 'N')
+    assert (0, 5) in game.board.grid[0][2].get_moves(game.board, (0, 2))
+    assert not game.board.is_in_check('black')
+
+
+def test_checkers_no_moves():
+    game = _empty_game('checkers', 'black')
+    game.board.grid[0][1] = Checker('black')
+    game.board.grid[1][0] = Checker('white')
+    game.board.grid[1][2] = Checker('white')
+    game.board.grid[2][3] = Checker('white')
+    assert game.game_over_message() == "Нет ходов! Победили белые"
+
+    game.board.grid[2][3] = None
+    assert game.game_over_message() is None
+
+
+@pytest.fixture
+def store():
+    store = PositionStore(64)
+    yield store
+    store.close()
+    store.unlink()
+
+
+def test_store_round_trip(store):
+    store.put(123, -42, 3, PositionStore.LOWER)
+    assert store.get(123) == (-42, 3, PositionStore.LOWER)
+    assert store.get(124) is None
+
+
+def test_store_attach_by_name(store):
+    store.put(123, 7, 1)
+    other = PositionStore(4096, name=store.name)
+    assert other.size == store.size
+    assert other.get(123) == (7, 1, PositionStore.EXACT)
+    other.put(456, 8, 2)
+    other.close()
+    assert store.get(456) == (8, 2, PositionStore.EXACT)
+
+
+def test_store_file_survives_reopen(tmp_path):
+    path = str(tmp_path / 'positions.bin')
+    store = PositionStore(64, path=path)
+    store.put(123, 5, 2, PositionStore.UPPER)
+    store.close()
+
+    store = PositionStore(8, path=path)
+    assert store.size == 64
+    assert store.get(123) == (5, 2, PositionStore.UPPER)
+    store.close()
+
+
+def test_store_deeper_entry_wins(store):
+    store.put(123, 1, 5)
+    store.put(123, 2, 3)
+    assert store.get(123) == (1, 5, PositionStore.EXACT)
+    store.put(123, 3, 6)
+    assert store.get(123) == (3, 6, PositionStore.EXACT)
+
+
+def test_store_slot_collision(store):
+    store.put(123, 1, 1)
+    assert store.get(123 + store.size) is None
+
+
+def test_store_rejects_out_of_range(store):
+    for args in [(123, 1 << 31, 0), (123, -(1 << 31) - 1, 0), (123, 0, -1), (123, 0, 1 << 16),
+                 (123, 0, 0, 3), (-1, 0, 0), (1 << 64, 0, 0)]:
+        with pytest.raises(ValueError):
+            store.put(*args)
+    with pytest.raises(ValueError):
+        store.get(-1)
+    store.put(123, (1 << 31) - 1, 0xFFFF)
+    assert store.get(123) == ((1 << 31) - 1, 0xFFFF, PositionStore.EXACT)
+
+
+def test_position_key():
+    board = Board()
+    key = board.position_key('white')
+    assert key == Board().position_key('white')
+    assert key != board.position_key('black')
+    assert board.move_piece((6, 4), (4, 4))
+    assert board.position_key('white') != key